@@ -3,26 +3,69 @@
 Station 4+5: Embeddings + Pinecone Upload
 Python, zero dependencies (only stdlib).
 
+Modes:
+  (default)   Upsert into the namespace currently published for retrieval.
+  --rebuild   Full rebuild: shard chunks by law `code` across worker
+              processes, write into a fresh versioned namespace, verify
+              vector counts, publish it via the pointer record, then
+              garbage-collect older namespaces. Queries keep hitting the
+              previous namespace until the pointer flips.
+  --resume    Continue a failed --rebuild in its namespace, embedding
+              only the chunks that are not there yet.
+  --publish   Point retrieval at an existing namespace (rollback). Its
+              vector count must match the current chunk count unless
+              --force is given.
+
 Run:
   export OPENAI_API_KEY=sk-...
   export PINECONE_API_KEY=pcsk_...
   python3 scripts/04-embed-and-upload.py
+  python3 scripts/04-embed-and-upload.py --rebuild --workers 4
+  python3 scripts/04-embed-and-upload.py --rebuild --resume ua-law-20260215-120000
+  python3 scripts/04-embed-and-upload.py --publish ua-law-20260215-120000
 """
 
-import json, os, sys, time, urllib.request, urllib.error
+import argparse, json, os, random, re, sys, time, urllib.parse, urllib.request, urllib.error
+from multiprocessing import Pool
 
 OPENAI_KEY = os.environ.get('OPENAI_API_KEY', '')
 PINECONE_KEY = os.environ.get('PINECONE_API_KEY', '')
 
 INDEX_NAME = 'agentis-law'
-NAMESPACE = 'ua-law-v1'
+NAMESPACE = 'ua-law-v1'  # legacy live namespace, used until a pointer is published
+NAMESPACE_PREFIX = 'ua-law-'
+# Only namespaces created by --rebuild match this; GC never touches anything else
+VERSIONED_NAMESPACE = re.compile(r'^ua-law-\d{8}-\d{6}$')
+DIMENSION = 1536
 MAX_CHUNK = 6000
 BATCH_SIZE = 30
 
+# Pointer record: a single vector in its own namespace whose metadata names
+# the namespace retrieval should query (read by law-rag-service.ts).
+META_NAMESPACE = 'agentis-law-meta'
+POINTER_ID = 'current-namespace'
+
+# Rebuild workers wait on OpenAI/Pinecone, not CPU; more mostly buys 429s
+DEFAULT_WORKERS = 4
+RETRY_ATTEMPTS = 6
+RETRY_BASE_DELAY = 2   # seconds, doubled per attempt
+RETRY_MAX_DELAY = 60
+RETRY_PASSES = 2       # re-run failed batches before verifying a rebuild
+
+VERIFY_TIMEOUT = 180  # seconds to wait for describe_index_stats to catch up
+VERIFY_INTERVAL = 5
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE = os.path.join(SCRIPT_DIR, '..', 'data', 'categorized', 'all-articles-categorized.json')
 
 
+class HTTPStatusError(Exception):
+    def __init__(self, status, body, retry_after=None):
+        super().__init__(f"HTTP {status}: {body}")
+        self.status = status
+        self.retry_after = retry_after
+
+
 def http_json(method, url, body=None, headers=None):
     hdrs = {'Content-Type': 'application/json'}
     if headers:
@@ -35,7 +78,29 @@ def http_json(method, url, body=None, headers=None):
             return json.loads(text) if text.strip() else {}
     except urllib.error.HTTPError as e:
         error_body = e.read().decode('utf-8')[:300]
-        raise Exception(f"HTTP {e.code}: {error_body}")
+        try:
+            retry_after = float(e.headers.get('Retry-After') or 0) or None
+        except ValueError:
+            retry_after = None
+        raise HTTPStatusError(e.code, error_body, retry_after)
+
+
+def with_retry(fn, label=''):
+    """Call fn() with exponential backoff. 429s wait at least Retry-After;
+    other 4xx errors are not retried."""
+    for r in range(RETRY_ATTEMPTS):
+        try:
+            return fn()
+        except Exception as e:
+            status = getattr(e, 'status', None)
+            if r == RETRY_ATTEMPTS - 1 or (status and 400 <= status < 500 and status not in (408, 429)):
+                raise
+            delay = min(RETRY_BASE_DELAY * 2 ** r, RETRY_MAX_DELAY)
+            if status == 429 and e.retry_after:
+                delay = max(delay, e.retry_after)
+            delay += random.uniform(0, 1)  # de-synchronise parallel workers
+            print(f'  {label}retry {r + 1}/{RETRY_ATTEMPTS - 1} in {delay:.0f}s ({str(e)[:80]})')
+            time.sleep(delay)
 
 
 def openai_embed(texts):
@@ -55,7 +120,7 @@ def ensure_pinecone_index():
         print('  Creating Pinecone index (wait ~60s)...')
         try:
             pinecone_api('POST', 'https://api.pinecone.io/indexes', {
-                'name': INDEX_NAME, 'dimension': 1536, 'metric': 'cosine',
+                'name': INDEX_NAME, 'dimension': DIMENSION, 'metric': 'cosine',
                 'spec': {'serverless': {'cloud': 'aws', 'region': 'us-east-1'}}
             })
         except Exception as e:
@@ -73,31 +138,105 @@ def ensure_pinecone_index():
     return f"https://{idx['host']}"
 
 
+def fetch_existing_ids(host, namespace, ids):
+    query = urllib.parse.urlencode({'ids': ids, 'namespace': namespace}, doseq=True)
+    res = pinecone_api('GET', f'{host}/vectors/fetch?{query}')
+    return set(res.get('vectors') or {})
+
+
+def get_current_namespace(host):
+    """Namespace retrieval currently reads from (pointer record, else legacy)."""
+    res = pinecone_api('GET', f'{host}/vectors/fetch?ids={POINTER_ID}&namespace={META_NAMESPACE}')
+    rec = (res.get('vectors') or {}).get(POINTER_ID)
+    if rec and rec.get('metadata', {}).get('namespace'):
+        return rec['metadata']['namespace']
+    return NAMESPACE
+
+
+def publish_namespace(host, namespace, vector_count, previous):
+    # Cosine indexes reject all-zero vectors, so the pointer carries a unit vector
+    values = [1.0] + [0.0] * (DIMENSION - 1)
+    pinecone_api('POST', f'{host}/vectors/upsert', {
+        'namespace': META_NAMESPACE,
+        'vectors': [{'id': POINTER_ID, 'values': values, 'metadata': {
+            'namespace': namespace,
+            'previous': previous,
+            'vector_count': vector_count,
+            'published_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        }}],
+    })
+
+
+def namespace_vector_count(host, namespace):
+    stats = pinecone_api('POST', f'{host}/describe_index_stats', {})
+    return stats.get('namespaces', {}).get(namespace, {}).get('vectorCount', 0)
+
+
+# Cyrillic → ASCII for vector ids (Pinecone requires ASCII ids).
+# Must stay in sync with toAsciiId() in 04-embed.js so both uploaders
+# write the same ids into the same namespace.
+CYR_TO_LAT = {
+    'А': 'A', 'Б': 'B', 'В': 'V', 'Г': 'H', 'Ґ': 'G', 'Д': 'D', 'Е': 'E', 'Є': 'Ye',
+    'Ж': 'Zh', 'З': 'Z', 'И': 'Y', 'І': 'I', 'Ї': 'Yi', 'Й': 'Y', 'К': 'K', 'Л': 'L',
+    'М': 'M', 'Н': 'N', 'О': 'O', 'П': 'P', 'Р': 'R', 'С': 'S', 'Т': 'T', 'У': 'U',
+    'Ф': 'F', 'Х': 'Kh', 'Ц': 'Ts', 'Ч': 'Ch', 'Ш': 'Sh', 'Щ': 'Shch', 'Ь': '',
+    'Ю': 'Yu', 'Я': 'Ya',
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'h', 'ґ': 'g', 'д': 'd', 'е': 'e', 'є': 'ye',
+    'ж': 'zh', 'з': 'z', 'и': 'y', 'і': 'i', 'ї': 'yi', 'й': 'y', 'к': 'k', 'л': 'l',
+    'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'kh', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'shch', 'ь': '',
+    'ю': 'yu', 'я': 'ya', "'": '', '\u02bc': '',
+}
+
+
+def to_ascii_id(s):
+    out = []
+    for ch in s:
+        if ch in CYR_TO_LAT:
+            out.append(CYR_TO_LAT[ch])
+        elif '\x20' <= ch <= '\x7e':
+            out.append(ch)
+        else:
+            out.append('_')
+    # Pinecone ID: alphanumeric + hyphen + underscore, max 512 chars
+    return re.sub(r'[^a-zA-Z0-9_\-.]', '_', ''.join(out))[:500]
+
+
 def article_to_chunks(art):
-    header = f"{art['code']} Стаття {art['article_number']}. {art.get('title', '')}"
-    full = f"{header}\n\n{art.get('text', '')}"
+    """Same chunking, ids and metadata as articleToChunks() in 04-embed.js."""
+    code = art.get('code') or ''
+    num = art.get('article_number') or ''
+    unit_type = art.get('unit_type') or 'стаття'
+    unit_label = f'п.{num}' if unit_type == 'пункт' else f'Стаття {num}'
+    header = f"{code} {unit_label}. {art.get('title') or ''}"
+    text = art.get('text') or ''
+    full = f"{header}\n\n{text}"
+
+    raw_id = art.get('id') or f'{code}-{num}'
+    safe_id = to_ascii_id(raw_id)
+
     meta = {
-        'article_id': art['id'], 'code': art['code'],
-        'article_number': art['article_number'],
+        'article_id': raw_id,  # original Cyrillic id in metadata (OK there)
+        'code': code,
+        'article_number': num,
+        'unit_type': unit_type,
         'title': (art.get('title') or '')[:200],
         'chapter': art.get('chapter') or '',
-        'chapter_title': (art.get('chapter_title') or '')[:200],
-        'categories': ','.join(art.get('categories', [])),
-        'tags': ','.join(art.get('tags', [])),
-        'importance': art.get('importance', 'normal'),
-        'text_length': len(art.get('text', '')),
+        'section': art.get('section') or '',
+        'book': art.get('book') or '',
+        'categories': ','.join(art.get('categories') or []),
+        'tags': ','.join(art.get('tags') or []),
+        'importance': art.get('importance') or 'normal',
+        'text_length': len(text),
     }
 
     if len(full) <= MAX_CHUNK:
-        return [{'id': art['id'], 'text': full,
+        return [{'id': safe_id, 'text': full,
                  'metadata': {**meta, 'chunk_index': 0, 'total_chunks': 1}}]
 
     # Split long articles
     chunks = []
     max_len = MAX_CHUNK - len(header) - 30
-    if max_len < 500:
-        max_len = 500
-    text = art.get('text', '')
     start = 0
     idx = 0
     overlap = 200
@@ -105,45 +244,270 @@ def article_to_chunks(art):
     while start < len(text):
         end = min(start + max_len, len(text))
 
-        # Try to break at sentence boundary
+        # Break at sentence boundary (same search as lastIndexOf in 04-embed.js)
         if end < len(text):
-            bp = max(text.rfind('.', start, end), text.rfind('\n', start, end))
+            bp = max(text.rfind('.', 0, end + 1), text.rfind('\n', 0, end + 1))
             if bp > start + max_len * 0.5:
                 end = bp + 1
 
         chunks.append({
-            'id': f"{art['id']}_chunk{idx}",
+            'id': f'{safe_id}_chunk{idx}',
             'text': f"{header} [ч.{idx+1}]\n\n{text[start:end].strip()}",
             'metadata': {**meta, 'chunk_index': idx, 'total_chunks': 0}
         })
         idx += 1
 
-        # FIXED: if we reached the end, stop
         if end >= len(text):
             break
 
-        # Advance with overlap, but ALWAYS move forward
+        # Advance with overlap, always move forward
         new_start = end - overlap
-        if new_start <= start:
-            new_start = start + 1  # force progress
-        start = new_start
+        start = start + 1 if new_start <= start else new_start
 
     for c in chunks:
         c['metadata']['total_chunks'] = len(chunks)
     return chunks
 
 
+def upload_chunks(host, chunks, namespace, label='', skip_existing=False):
+    """Embed + upsert chunks in batches. Returns (uploaded, tokens, failed_chunks).
+
+    With skip_existing, chunks already present in the namespace are counted
+    as uploaded without being re-embedded (used by --resume).
+    """
+    total = len(chunks)
+    total_batches = (total + BATCH_SIZE - 1) // BATCH_SIZE
+    total_tokens = 0
+    uploaded = 0
+    failed = []
+
+    for i in range(0, total, BATCH_SIZE):
+        batch = chunks[i:i+BATCH_SIZE]
+        bnum = i // BATCH_SIZE + 1
+        # One print per batch so parallel workers don't interleave lines
+        note = f'  {label}[{bnum}/{total_batches}] '
+
+        try:
+            if skip_existing:
+                existing = with_retry(
+                    lambda: fetch_existing_ids(host, namespace, [c['id'] for c in batch]), label)
+                uploaded += len(existing)
+                batch = [c for c in batch if c['id'] not in existing]
+                if not batch:
+                    print(note + f'⏭️  {uploaded}/{total}'); continue
+
+            # Embed
+            emb = with_retry(lambda: openai_embed([c['text'] for c in batch]), label)
+            total_tokens += emb.get('usage', {}).get('total_tokens', 0)
+
+            vectors = [{'id': batch[j]['id'], 'values': emb['data'][j]['embedding'],
+                         'metadata': batch[j]['metadata']} for j in range(len(batch))]
+
+            # Upload
+            with_retry(lambda: pinecone_api('POST', f'{host}/vectors/upsert',
+                                            {'vectors': vectors, 'namespace': namespace}), label)
+        except Exception as e:
+            failed.extend(batch)
+            print(note + f'❌ {str(e)[:80]}'); continue
+
+        uploaded += len(vectors)
+        cost = (total_tokens / 1_000_000) * 0.02
+        print(note + f'✅ {uploaded}/{total} (${cost:.4f})')
+        time.sleep(0.3)
+
+    return uploaded, total_tokens, failed
+
+
+def shard_by_code(chunks, workers):
+    """Group chunks by law code, then spread codes over workers (largest first)."""
+    by_code = {}
+    for c in chunks:
+        by_code.setdefault(c['metadata']['code'], []).append(c)
+    shards = [[] for _ in range(min(workers, len(by_code)) or 1)]
+    for code in sorted(by_code, key=lambda k: len(by_code[k]), reverse=True):
+        min(shards, key=len).extend(by_code[code])
+    return [s for s in shards if s]
+
+
+def upload_shard(args):
+    host, namespace, shard_num, chunks, skip_existing = args
+    codes = sorted({c['metadata']['code'] for c in chunks})
+    print(f'  [w{shard_num}] {len(chunks)} chunks: {", ".join(codes)}')
+    uploaded, tokens, failed = upload_chunks(host, chunks, namespace, label=f'w{shard_num} ',
+                                             skip_existing=skip_existing)
+    return shard_num, tokens, failed
+
+
+def verify_namespace(host, namespace, expected):
+    """Poll describe_index_stats until the namespace holds `expected` vectors."""
+    deadline = time.time() + VERIFY_TIMEOUT
+    count = 0
+    while time.time() < deadline:
+        count = namespace_vector_count(host, namespace)
+        if count == expected:
+            return count
+        time.sleep(VERIFY_INTERVAL)
+    return count
+
+
+def collect_garbage(host, published, keep):
+    """Delete versioned namespaces older than `published`, except `keep`.
+
+    Newer ones may belong to a rebuild still in flight; unversioned ones
+    (the legacy NAMESPACE) are never touched.
+    """
+    stats = with_retry(lambda: pinecone_api('POST', f'{host}/describe_index_stats', {}), 'gc ')
+    for name in sorted(stats.get('namespaces', {})):
+        if not VERSIONED_NAMESPACE.match(name) or name >= published or name in keep:
+            continue
+        print(f'  🗑️  {name}')
+        with_retry(lambda: pinecone_api('POST', f'{host}/vectors/delete',
+                                        {'deleteAll': True, 'namespace': name}), 'gc ')
+
+
+def switch_pointer(host, namespace, count):
+    """Publish `namespace`; returns the namespace it replaced.
+
+    The live namespace is re-read right before the switch: a rebuild can run
+    for hours, and a --publish or another rebuild may have moved the pointer.
+    """
+    previous = with_retry(lambda: get_current_namespace(host), 'publish ')
+    with_retry(lambda: publish_namespace(host, namespace, count, previous), 'publish ')
+    return previous
+
+
+def is_publishable(namespace):
+    return namespace == NAMESPACE or bool(VERSIONED_NAMESPACE.match(namespace))
+
+
+def expected_vector_count():
+    """Unique chunk ids for the current categorized data."""
+    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+        articles = json.load(f)
+    return len({c['id'] for art in articles for c in article_to_chunks(art)})
+
+
+def rebuild(host, all_chunks, workers, resume=None):
+    if not all_chunks:
+        print('❌ Nothing to upload'); sys.exit(1)
+    live = get_current_namespace(host)
+    if resume:
+        if not VERSIONED_NAMESPACE.match(resume) or resume == live:
+            print(f'❌ Cannot resume into "{resume}": not an unpublished rebuild namespace')
+            sys.exit(1)
+        namespace = resume
+    else:
+        namespace = f"{NAMESPACE_PREFIX}{time.strftime('%Y%m%d-%H%M%S', time.gmtime())}"
+    # Duplicate ids overwrite each other, so count unique ids
+    expected = len({c['id'] for c in all_chunks})
+    shards = shard_by_code(all_chunks, workers)
+
+    print(f'\n🔨 {"Resume" if resume else "Rebuild"} → "{namespace}" (live: "{live}")')
+    print(f'   {len(all_chunks)} chunks, {len(shards)} workers\n')
+
+    with Pool(len(shards)) as pool:
+        results = pool.map(upload_shard, [(host, namespace, n + 1, shard, bool(resume))
+                                          for n, shard in enumerate(shards)])
+
+    total_tokens = sum(r[1] for r in results)
+    failed = [c for r in results for c in r[2]]
+
+    # Failed batches are usually rate limits; retry them once the workers are done
+    for p in range(RETRY_PASSES):
+        if not failed:
+            break
+        print(f'\n🔁 Retrying {len(failed)} failed chunks (pass {p + 1}/{RETRY_PASSES})...')
+        _, tokens, failed = upload_chunks(host, failed, namespace, label='retry ')
+        total_tokens += tokens
+
+    print(f'\n🔍 Verifying "{namespace}" (expect {expected} vectors)...')
+    count = verify_namespace(host, namespace, expected) if not failed else None
+    if failed or count != expected:
+        if failed:
+            print(f'❌ {len(failed)} chunks failed to upload. Pointer NOT switched;')
+        else:
+            print(f'❌ Vector count {count} != {expected}. Pointer NOT switched;')
+        print(f'   "{live}" stays live. Continue without re-embedding what is there:')
+        print(f'   python3 scripts/04-embed-and-upload.py --rebuild --resume {namespace}')
+        sys.exit(1)
+
+    try:
+        previous = switch_pointer(host, namespace, count)
+    except Exception as e:
+        print(f'❌ Publishing failed: {str(e)[:120]}')
+        print(f'   "{namespace}" is verified ({count} vectors). Publish it with:')
+        print(f'   python3 scripts/04-embed-and-upload.py --publish {namespace}')
+        sys.exit(1)
+    print(f'✅ Published "{namespace}" ({count} vectors), replacing "{previous}"')
+
+    # Keep the replaced namespace: servers may still hold it in their pointer cache,
+    # and re-publishing it is the rollback path.
+    print('\n🧹 Garbage-collecting old namespaces...')
+    try:
+        collect_garbage(host, namespace, keep={previous})
+    except Exception as e:
+        print(f'  ⚠️  GC failed ({str(e)[:80]}); old namespaces left in place')
+
+    print()
+    print('=' * 45)
+    print('  ✅ REBUILD DONE')
+    print(f'  Namespace: {namespace}')
+    print(f'  Vectors: {count}')
+    print(f'  Tokens: {total_tokens:,}')
+    print(f'  Cost: ~${(total_tokens / 1_000_000) * 0.02:.4f}')
+    print('=' * 45)
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Embed articles and upload to Pinecone')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Full rebuild into a fresh namespace, then switch the pointer')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Worker processes for --rebuild (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--resume', metavar='NAMESPACE',
+                        help='With --rebuild: continue into an existing rebuild namespace')
+    parser.add_argument('--publish', metavar='NAMESPACE',
+                        help='Point retrieval at an existing namespace and exit')
+    parser.add_argument('--force', action='store_true',
+                        help='With --publish: skip the vector count check')
+    args = parser.parse_args()
+    if args.resume and not args.rebuild:
+        parser.error('--resume requires --rebuild')
+
     print('=' * 45)
     print('  AGENTIS LAW — Embeddings + Pinecone')
     print('=' * 45)
     print()
 
-    if not OPENAI_KEY:
-        print('❌ export OPENAI_API_KEY=sk-...'); sys.exit(1)
     if not PINECONE_KEY:
         print('❌ export PINECONE_API_KEY=pcsk_...'); sys.exit(1)
 
+    if args.force and not args.publish:
+        parser.error('--force requires --publish')
+    if args.publish:
+        if not is_publishable(args.publish):
+            print(f'❌ "{args.publish}" is not a law namespace ({NAMESPACE} or {NAMESPACE_PREFIX}YYYYMMDD-HHMMSS)')
+            sys.exit(1)
+        host = ensure_pinecone_index()
+        count = namespace_vector_count(host, args.publish)
+        if not count:
+            print(f'❌ Namespace "{args.publish}" is empty or missing'); sys.exit(1)
+        if not args.force:
+            if not os.path.exists(INPUT_FILE):
+                print(f'❌ {INPUT_FILE} not found, cannot check the vector count. Use --force.')
+                sys.exit(1)
+            expected = expected_vector_count()
+            if count != expected:
+                print(f'❌ "{args.publish}" holds {count} vectors, current data has {expected} chunks.')
+                print('   Rolling back to a build of older data? Re-run with --force.')
+                sys.exit(1)
+        previous = switch_pointer(host, args.publish, count)
+        print(f'✅ Published "{args.publish}" ({count} vectors), replacing "{previous}"')
+        return
+
+    if not OPENAI_KEY:
+        print('❌ export OPENAI_API_KEY=sk-...'); sys.exit(1)
+
     # 1. Load & chunk
     print('📖 Loading articles...')
     with open(INPUT_FILE, 'r', encoding='utf-8') as f:
@@ -162,53 +526,14 @@ def main():
     host = ensure_pinecone_index()
     print(f'   {host}')
 
-    # 3. Embed + upload
-    total = len(all_chunks)
-    total_batches = (total + BATCH_SIZE - 1) // BATCH_SIZE
-    total_tokens = 0
-    uploaded = 0
+    if args.rebuild:
+        rebuild(host, all_chunks, max(1, args.workers), resume=args.resume)
+        return
 
-    print(f'\n🚀 {total} chunks in {total_batches} batches...\n')
-
-    for i in range(0, total, BATCH_SIZE):
-        batch = all_chunks[i:i+BATCH_SIZE]
-        bnum = i // BATCH_SIZE + 1
-        sys.stdout.write(f'  [{bnum}/{total_batches}] ')
-        sys.stdout.flush()
-
-        # Embed
-        emb = None
-        for r in range(3):
-            try:
-                emb = openai_embed([c['text'] for c in batch])
-                break
-            except Exception as e:
-                sys.stdout.write(f'retry...')
-                sys.stdout.flush()
-                time.sleep(3 * (r + 1))
-        if not emb:
-            print('❌ skip'); continue
-
-        total_tokens += emb.get('usage', {}).get('total_tokens', 0)
-
-        vectors = [{'id': batch[j]['id'], 'values': emb['data'][j]['embedding'],
-                     'metadata': batch[j]['metadata']} for j in range(len(batch))]
-
-        # Upload
-        for r in range(3):
-            try:
-                pinecone_api('POST', f'{host}/vectors/upsert',
-                             {'vectors': vectors, 'namespace': NAMESPACE})
-                break
-            except Exception as e:
-                sys.stdout.write('pine-retry...')
-                sys.stdout.flush()
-                time.sleep(3 * (r + 1))
-
-        uploaded += len(vectors)
-        cost = (total_tokens / 1_000_000) * 0.02
-        print(f'✅ {uploaded}/{total} (${cost:.4f})')
-        time.sleep(0.3)
+    # 3. Embed + upload into the live namespace
+    namespace = get_current_namespace(host)
+    print(f'\n🚀 {len(all_chunks)} chunks → "{namespace}"...\n')
+    uploaded, total_tokens, failed = upload_chunks(host, all_chunks, namespace)
 
     # 4. Stats
     time.sleep(3)
@@ -218,9 +543,10 @@ def main():
         print('=' * 45)
         print('  ✅ DONE')
         print(f'  Uploaded: {uploaded}')
+        print(f'  Failed: {len(failed)}')
         print(f'  Pinecone vectors: {stats.get("totalVectorCount", "?")}')
-        ns = stats.get('namespaces', {}).get(NAMESPACE, {})
-        print(f'  Namespace "{NAMESPACE}": {json.dumps(ns)}')
+        ns = stats.get('namespaces', {}).get(namespace, {})
+        print(f'  Namespace "{namespace}": {json.dumps(ns)}')
         print(f'  Tokens: {total_tokens:,}')
         print(f'  Cost: ~${(total_tokens / 1_000_000) * 0.02:.4f}')
         print('=' * 45)
@@ -6,7 +6,9 @@
  * Replaces 04-embed-and-upload.py.
  * 
  * Reads:  data/categorized/all-articles-categorized.json
- * Writes: Pinecone index "agentis-law", namespace "ua-law-v1"
+ * Writes: Pinecone index "agentis-law", the namespace currently published for
+ *         retrieval (pointer "current-namespace" in "agentis-law-meta",
+ *         written by 04-embed-and-upload.py --rebuild; "ua-law-v1" if none)
  * 
  * Usage:
  *   export OPENAI_API_KEY=sk-...
@@ -15,12 +17,15 @@
  *   node scripts/04-embed.js --dry-run        — chunk + count, no API calls
  *   node scripts/04-embed.js --stats          — show Pinecone stats only
  *   node scripts/04-embed.js --delete-all     — wipe namespace (careful!)
+ *
+ * Full rebuilds (new namespace + pointer switch) are done by
+ *   python3 scripts/04-embed-and-upload.py --rebuild
  * 
  * Env vars:
  *   OPENAI_API_KEY     — required for embeddings
  *   PINECONE_API_KEY   — required for upload
  *   PINECONE_INDEX     — index name (default: agentis-law)
- *   PINECONE_NAMESPACE — namespace (default: ua-law-v1)
+ *   PINECONE_NAMESPACE — namespace override (default: published namespace)
  */
 
 const fs = require('fs');
@@ -31,7 +36,10 @@ const path = require('path');
 // ═══════════════════════════════════════
 
 const INDEX_NAME = process.env.PINECONE_INDEX || 'agentis-law';
-const NAMESPACE = process.env.PINECONE_NAMESPACE || 'ua-law-v1';
+const NAMESPACE_OVERRIDE = process.env.PINECONE_NAMESPACE || '';
+const LEGACY_NAMESPACE = 'ua-law-v1'; // live until a pointer is published
+const META_NAMESPACE = 'agentis-law-meta';
+const POINTER_ID = 'current-namespace';
 const EMBEDDING_MODEL = 'text-embedding-3-small'; // 1536 dimensions, $0.02/1M tokens
 const MAX_CHUNK_CHARS = 6000;  // ~1500 tokens for Ukrainian text
 const BATCH_SIZE = 30;         // Vectors per Pinecone upsert
@@ -147,10 +155,29 @@ async function pineconeApi(method, endpoint, body) {
   return httpJson(method, `${host}${endpoint}`, body, { 'Api-Key': key });
 }
 
+let _namespace = null;
+
+/**
+ * Namespace retrieval reads from: the pointer record, else the legacy one.
+ * Pointer lookup errors are NOT swallowed — uploading into a namespace
+ * nobody queries is worse than failing.
+ */
+async function getNamespace() {
+  if (_namespace) return _namespace;
+  if (NAMESPACE_OVERRIDE) {
+    _namespace = NAMESPACE_OVERRIDE;
+    return _namespace;
+  }
+  const params = new URLSearchParams({ ids: POINTER_ID, namespace: META_NAMESPACE });
+  const data = await withRetry(() => pineconeApi('GET', `/vectors/fetch?${params}`), 'pointer');
+  _namespace = data.vectors?.[POINTER_ID]?.metadata?.namespace || LEGACY_NAMESPACE;
+  return _namespace;
+}
+
 async function pineconeUpsert(vectors) {
   return pineconeApi('POST', '/vectors/upsert', {
     vectors,
-    namespace: NAMESPACE,
+    namespace: await getNamespace(),
   });
 }
 
@@ -161,7 +188,7 @@ async function pineconeStats() {
 async function pineconeDeleteAll() {
   return pineconeApi('POST', '/vectors/delete', {
     deleteAll: true,
-    namespace: NAMESPACE,
+    namespace: await getNamespace(),
   });
 }
 
@@ -289,7 +316,7 @@ async function showStats() {
   const host = await getPineconeHost();
   console.log(`  Host: ${host}`);
   console.log(`  Index: ${INDEX_NAME}`);
-  console.log(`  Namespace: ${NAMESPACE}\n`);
+  console.log(`  Namespace: ${await getNamespace()}\n`);
 
   const stats = await pineconeStats();
   console.log(`  Total vectors: ${stats.totalVectorCount || 0}`);
@@ -306,7 +333,7 @@ async function showStats() {
 }
 
 async function deleteAll() {
-  console.log(`\n🗑️  Deleting ALL vectors in namespace "${NAMESPACE}"...`);
+  console.log(`\n🗑️  Deleting ALL vectors in namespace "${await getNamespace()}"...`);
   await pineconeDeleteAll();
   console.log('  ✅ Done\n');
 }
@@ -360,7 +387,8 @@ async function embedAndUpload(articles) {
   // 2. Verify Pinecone
   console.log('📌 Pinecone...');
   const host = await getPineconeHost();
-  console.log(`   ${host}\n`);
+  const namespace = await getNamespace();
+  console.log(`   ${host} ("${namespace}")\n`);
 
   // 3. Embed + upload in batches
   const totalBatches = Math.ceil(allChunks.length / BATCH_SIZE);
@@ -422,8 +450,8 @@ async function embedAndUpload(articles) {
 
   try {
     const stats = await pineconeStats();
-    const ns = stats.namespaces?.[NAMESPACE];
-    console.log(`  📌 Pinecone:    ${ns?.vectorCount || '?'} vectors in "${NAMESPACE}"`);
+    const ns = stats.namespaces?.[namespace];
+    console.log(`  📌 Pinecone:    ${ns?.vectorCount || '?'} vectors in "${namespace}"`);
     console.log(`  📦 Total index: ${stats.totalVectorCount || '?'} vectors`);
   } catch (err) {
     console.log(`  📌 Pinecone:    (stats unavailable)`);
@@ -139,10 +139,13 @@ const TEST_QUERIES = [
 // ═══════════════════════════════════════
 
 const PINECONE_INDEX = 'agentis-law';
-const PINECONE_NAMESPACE = 'ua-law-v1';
+const PINECONE_NAMESPACE = 'ua-law-v1'; // fallback until a pointer is published
+const PINECONE_META_NAMESPACE = 'agentis-law-meta';
+const PINECONE_POINTER_ID = 'current-namespace';
 const EMBEDDING_MODEL = 'text-embedding-3-small';
 
 let pineconeHost = null;
+let pineconeNamespace = null;
 
 async function httpJson(method, url, body, headers = {}) {
   const opts = {
@@ -170,6 +173,17 @@ async function getPineconeHost() {
   return pineconeHost;
 }
 
+async function getPineconeNamespace() {
+  if (pineconeNamespace) return pineconeNamespace;
+  const host = await getPineconeHost();
+  const data = await httpJson('GET',
+    `${host}/vectors/fetch?ids=${PINECONE_POINTER_ID}&namespace=${PINECONE_META_NAMESPACE}`, null, {
+      'Api-Key': process.env.PINECONE_API_KEY,
+    });
+  pineconeNamespace = data.vectors?.[PINECONE_POINTER_ID]?.metadata?.namespace || PINECONE_NAMESPACE;
+  return pineconeNamespace;
+}
+
 async function embed(text) {
   const data = await httpJson('POST', 'https://api.openai.com/v1/embeddings', {
     model: EMBEDDING_MODEL,
@@ -184,7 +198,7 @@ async function search(vector, topK = 20, filter = null) {
     vector,
     topK,
     includeMetadata: true,
-    namespace: PINECONE_NAMESPACE,
+    namespace: await getPineconeNamespace(),
   };
   if (filter) body.filter = filter;
   const data = await httpJson('POST', `${host}/query`, body, {
@@ -325,8 +339,9 @@ async function main() {
   const stats = await httpJson('POST', `${host}/describe_index_stats`, {}, {
     'Api-Key': process.env.PINECONE_API_KEY,
   });
-  const nsVectors = stats.namespaces?.[PINECONE_NAMESPACE]?.vectorCount || 0;
-  console.log(`\n📌 Pinecone: ${nsVectors} vectors in "${PINECONE_NAMESPACE}"`);
+  const namespace = await getPineconeNamespace();
+  const nsVectors = stats.namespaces?.[namespace]?.vectorCount || 0;
+  console.log(`\n📌 Pinecone: ${nsVectors} vectors in "${namespace}"`);
 
   // Filter tests
   const tests = specificTest
@@ -13,7 +13,9 @@ import json, os, sys, urllib.request, urllib.error
 OPENAI_KEY = os.environ.get('OPENAI_API_KEY', '')
 PINECONE_KEY = os.environ.get('PINECONE_API_KEY', '')
 PINECONE_HOST = os.environ.get('PINECONE_HOST', '')  # will auto-detect
-NAMESPACE = 'ua-law-v1'
+NAMESPACE = 'ua-law-v1'  # fallback when no pointer is published
+META_NAMESPACE = 'agentis-law-meta'
+POINTER_ID = 'current-namespace'
 
 
 def http_json(method, url, body=None, headers=None):
@@ -33,6 +35,13 @@ def get_host():
     return f"https://{idx['host']}"
 
 
+def get_namespace(host):
+    res = http_json('GET', f'{host}/vectors/fetch?ids={POINTER_ID}&namespace={META_NAMESPACE}',
+        headers={'Api-Key': PINECONE_KEY})
+    rec = (res.get('vectors') or {}).get(POINTER_ID) or {}
+    return rec.get('metadata', {}).get('namespace') or NAMESPACE
+
+
 def embed(text):
     res = http_json('POST', 'https://api.openai.com/v1/embeddings',
         body={'model': 'text-embedding-3-small', 'input': text},
@@ -40,9 +49,9 @@ def embed(text):
     return res['data'][0]['embedding']
 
 
-def search(host, vector, top_k=10):
+def search(host, namespace, vector, top_k=10):
     res = http_json('POST', f'{host}/query',
-        body={'vector': vector, 'topK': top_k, 'includeMetadata': True, 'namespace': NAMESPACE},
+        body={'vector': vector, 'topK': top_k, 'includeMetadata': True, 'namespace': namespace},
         headers={'Api-Key': PINECONE_KEY})
     return res.get('matches', [])
 
@@ -85,7 +94,8 @@ def main():
     print('=' * 50)
 
     host = get_host()
-    print(f'Pinecone: {host}\n')
+    namespace = get_namespace(host)
+    print(f'Pinecone: {host} ({namespace})\n')
 
     for test in TESTS:
         print(f'\n{test["name"]}')
@@ -95,7 +105,7 @@ def main():
         vector = embed(test['text'])
 
         # Search
-        matches = search(host, vector, top_k=10)
+        matches = search(host, namespace, vector, top_k=10)
 
         if not matches:
             print('  ❌ No results!')
@@ -11,6 +11,11 @@
  *   - Added topK=20 default (bigger base needs more results)
  *   - Added unit_type support (стаття/пункт) in formatArticlesForPrompt
  *   - Improved query preparation: extracts key legal terms
+ *
+ * Blue/green namespaces:
+ *   - Full rebuilds write into a fresh versioned namespace and then publish
+ *     it through a pointer record (04-embed-and-upload.py --rebuild).
+ *   - The live namespace is resolved from that pointer and cached briefly.
  * 
  * Usage:
  *   import { getLawContext } from '../../services/law-rag-service';
@@ -51,7 +56,10 @@ export interface RAGSearchOptions {
 // ═══════════════════════════════════════
 
 const PINECONE_INDEX = 'agentis-law';
-const PINECONE_NAMESPACE = 'ua-law-v1';
+const PINECONE_NAMESPACE = 'ua-law-v1'; // fallback until a pointer is published
+const PINECONE_META_NAMESPACE = 'agentis-law-meta';
+const PINECONE_POINTER_ID = 'current-namespace';
+const NAMESPACE_CACHE_TTL_MS = 60_000;
 const EMBEDDING_MODEL = 'text-embedding-3-small';
 
 /**
@@ -192,6 +200,7 @@ const CONTRACT_TYPE_CONFIG: Record<string, ContractTypeConfig> = {
 // ═══════════════════════════════════════
 
 let cachedPineconeHost: string | null = null;
+let cachedNamespace: { name: string; fetchedAt: number } | null = null;
 
 function getOpenAIKey(): string {
   const key = process.env.OPENAI_API_KEY;
@@ -218,6 +227,40 @@ async function getPineconeHost(): Promise<string> {
   return cachedPineconeHost;
 }
 
+/**
+ * Resolve the live namespace from the pointer record written by the
+ * rebuild script. On lookup failure keeps serving the last known value;
+ * with none known yet it falls back to the legacy namespace uncached.
+ */
+async function getPineconeNamespace(): Promise<string> {
+  if (cachedNamespace && Date.now() - cachedNamespace.fetchedAt < NAMESPACE_CACHE_TTL_MS) {
+    return cachedNamespace.name;
+  }
+  try {
+    const host = await getPineconeHost();
+    const params = new URLSearchParams({ ids: PINECONE_POINTER_ID, namespace: PINECONE_META_NAMESPACE });
+    const res = await fetch(`${host}/vectors/fetch?${params}`, {
+      headers: { 'Api-Key': getPineconeKey() },
+    });
+    if (!res.ok) throw new Error(`Pinecone fetch pointer failed: ${res.status}`);
+    const data = await res.json();
+    const name = data.vectors?.[PINECONE_POINTER_ID]?.metadata?.namespace || PINECONE_NAMESPACE;
+    if (cachedNamespace && cachedNamespace.name !== name) {
+      logger.info(`[LAW RAG] Namespace switched: ${cachedNamespace.name} → ${name}`);
+    }
+    cachedNamespace = { name, fetchedAt: Date.now() };
+  } catch (error) {
+    if (!cachedNamespace) {
+      // Cold start: don't pin the fallback for a full TTL, retry on the next request
+      logger.warn('[LAW RAG] Namespace pointer lookup failed, falling back to legacy namespace:', error);
+      return PINECONE_NAMESPACE;
+    }
+    logger.warn('[LAW RAG] Namespace pointer lookup failed, using last known:', error);
+    cachedNamespace = { name: cachedNamespace.name, fetchedAt: Date.now() };
+  }
+  return cachedNamespace.name;
+}
+
 async function generateEmbedding(text: string): Promise<number[]> {
   const res = await fetch('https://api.openai.com/v1/embeddings', {
     method: 'POST',
@@ -245,7 +288,7 @@ async function queryPinecone(
     vector,
     topK,
     includeMetadata: true,
-    namespace: PINECONE_NAMESPACE,
+    namespace: await getPineconeNamespace(),
   };
   if (filter) body.filter = filter;
 
@@ -545,7 +588,8 @@ export async function checkRAGHealth(): Promise<{
     });
     if (!res.ok) throw new Error(`Pinecone stats failed: ${res.status}`);
     const stats = await res.json();
-    const nsCount = stats.namespaces?.[PINECONE_NAMESPACE]?.vectorCount || 0;
+    const namespace = await getPineconeNamespace();
+    const nsCount = stats.namespaces?.[namespace]?.vectorCount || 0;
     return { ok: nsCount > 0, pineconeVectors: nsCount };
   } catch (error: any) {
     return { ok: false, pineconeVectors: 0, error: error.message };